@@ -0,0 +1,113 @@
+# ============================================================
+# GLIDE Simulation Framework (v4)
+# Batch check: TetherSystemBatch vs independent TetherSystem runs
+# ============================================================
+#
+#   python check_batch.py
+#
+# Runs the main.py scenario with gravity, EDT, winch and energy all on and
+# checks that TetherSystemBatch reproduces TetherSystem column by column, on
+# each path (compiled per-step, NumPy per-step, whole-trajectory kernel):
+#   - M=1 with the main.py parameters
+#   - M=3 sweeping every per-trajectory parameter, masses included
+
+import sys
+import numpy as np
+from physics.tether import TetherSystem, TetherSystemBatch
+from physics.motor import WinchMotor
+from physics.gravity import GravityField
+from physics.electrodynamic import ElectrodynamicTether
+from physics.energy import EnergyTracker
+
+params = {
+    "m_node": 25.0,
+    "m_payload": 150.0,
+    "L0": 300.0,
+    "k_tether": 1000.0,
+    "c_damp": 5.0,
+    "F_winch_max": 800.0,
+    "dt": 0.01,
+    "t_final": 20.0,
+    "release_time": 5.0,
+    "enable_gravity": True,
+    "enable_electrodynamic": True,
+    "enable_energy": True,
+}
+
+SWEEP = {
+    "m_node": [20.0, 25.0, 30.0],
+    "m_payload": [120.0, 150.0, 180.0],
+    "L0": [250.0, 300.0, 350.0],
+    "k_tether": [800.0, 1000.0, 1200.0],
+    "c_damp": [4.0, 5.0, 6.0],
+    "release_time": [4.0, 5.0, 6.0],
+}
+
+MODES = ("step", "numpy", "simulate")
+RTOL = 1e-9
+N = int(round(params["t_final"] / params["dt"]))
+
+
+def run(p, M=None, mode="step"):
+    """One trajectory (M=None) or a batch of M; returns the filled buffers."""
+    tether = TetherSystem(p) if M is None else TetherSystemBatch(p, M)
+    motor = WinchMotor(p)
+    gravity = GravityField(p)
+    electro = ElectrodynamicTether(p)
+    energy = EnergyTracker(p, N, M)
+
+    lead = (N,) if M is None else (N, M)
+    buffers = {"r_node": np.zeros(lead + (2,)), "r_payload": np.zeros(lead + (2,)),
+               "tension": np.zeros(lead)}
+    if mode == "simulate":
+        tether.simulate_into(motor, gravity, electro, buffers, energy)
+        buffers["energy"] = energy.log
+        return buffers
+
+    for i in range(N):
+        t = i * p["dt"]
+        if mode == "step":
+            tether.full_step(t, motor, gravity, electro, energy)
+        elif M is None:
+            tether.update(t, motor)
+            gravity.apply(tether)
+            electro.apply(tether)
+            energy.record(t, tether)
+        else:
+            tether.update(t, motor)
+            gravity.apply(tether)
+            electro.apply_batch(tether)
+            energy.record_batch(t, tether)
+        tether.step_into(i, buffers)
+    buffers["energy"] = energy.log
+    return buffers
+
+
+def compare(label, single, batch, m):
+    ok = True
+    for key, ref in single.items():
+        got = batch[key][:, m]
+        scale = max(float(np.abs(ref).max()), 1.0)
+        err = float(np.abs(got - ref).max()) / scale
+        passed = err <= RTOL
+        ok &= passed
+        print(f"[{label:<18s}] {key:<10s} max rel err {err:.2e}  {'ok' if passed else 'FAIL'}")
+    return ok
+
+
+def main():
+    ok = True
+    swept = dict(params, **SWEEP)
+    for mode in MODES:
+        ok &= compare(f"M=1 {mode}", run(params, None, mode), run(params, 1, mode), 0)
+        batch = run(swept, 3, mode)
+        for m in range(3):
+            column = dict(params, **{key: values[m] for key, values in SWEEP.items()})
+            ok &= compare(f"M=3 {mode} [{m}]", run(column, None, mode), batch, m)
+
+    print("\nBATCH CHECK", "PASSED" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
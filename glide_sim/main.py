@@ -27,36 +27,48 @@ params = {
     "release_time": 5.0,
     "enable_gravity": True,
     "enable_electrodynamic": True,
-    "enable_energy": True
+    "enable_energy": True,
+    "use_trajectory_kernel": True
 }
 
 # ------------------------------------------------------------
 # SUBSYSTEM INITIALIZATION
 # ------------------------------------------------------------
+dt = params["dt"]
+N = int(round(params["t_final"] / dt))
+times = np.arange(N) * dt  # plot axis only; the loop uses an integer counter
+
 tether = TetherSystem(params)
 motor = WinchMotor(params)
 gravity = GravityField(params)
 electro = ElectrodynamicTether(params)
-energy = EnergyTracker(params)
+energy = EnergyTracker(params, N)
 
 # ------------------------------------------------------------
 # SIMULATION LOOP
 # ------------------------------------------------------------
-positions_node, positions_payload, tether_forces = [], [], []
-energy_log = []
+# preallocated trajectory buffers (filled by index, no per-step appends/copies)
+positions_node = np.empty((N, 2))
+positions_payload = np.empty((N, 2))
+tether_forces = np.empty(N)
+energy_log = energy.log
+buffers = {
+    "r_node": positions_node,
+    "r_payload": positions_payload,
+    "tension": tether_forces,
+}
 
-for t in np.arange(0, params["t_final"], params["dt"]):
-    # update subsystems
-    tether.update(t, motor)
-    gravity.apply(tether)
-    electro.apply(tether)
-    energy.record(t, tether)
+if params["use_trajectory_kernel"]:
+    # entire trajectory in one compiled call (no per-step Python)
+    tether.simulate_into(motor, gravity, electro, buffers, energy)
+else:
+    for i in range(N):
+        t = i * dt
+        # update subsystems (tether + gravity + EDT + energy in one fused call)
+        tether.full_step(t, motor, gravity, electro, energy)
 
-    # record
-    positions_node.append(tether.r_node.copy())
-    positions_payload.append(tether.r_payload.copy())
-    tether_forces.append(tether.current_tension)
-    energy_log.append(energy.snapshot())
+        # record
+        tether.step_into(i, buffers)
 
 # ------------------------------------------------------------
 # VISUALIZATION
@@ -65,5 +77,5 @@ anim = GlideAnimator(tether, positions_node, positions_payload, params)
 anim.run()
 
 if params["enable_energy"]:
-    diag = DiagnosticPlots(tether, energy_log, tether_forces, params)
+    diag = DiagnosticPlots(tether, times, energy_log, tether_forces, params)
     diag.show()
@@ -0,0 +1,200 @@
+# ============================================================
+# GLIDE Simulation Framework (v4)
+# Compiled kernels: fused tether / gravity / EDT step
+# ============================================================
+
+import math
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional -> same kernels run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def step(rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, params_tuple, t, released):
+    """Advance node/payload state by one dt.
+
+    params_tuple = (m_node, m_payload, L0, k, c, dt, release_time,
+                    F_winch_max, t_winch_off, g, enable_gravity,
+                    F_reboost, enable_electrodynamic)
+
+    Returns (rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, released, tension).
+    """
+    (m_node, m_payload, L0, k, c, dt, release_time,
+     F_max, t_winch_off, g, enable_gravity,
+     F_reboost, enable_electro) = params_tuple
+
+    # release check (before computing forces)
+    if not released and t >= release_time:
+        released = True
+
+    # relative geometry
+    rx = rpx - rnx
+    ry = rpy - rny
+    dist = math.sqrt(rx * rx + ry * ry)
+    if dist != 0.0:
+        ux = rx / dist
+        uy = ry / dist
+    else:
+        ux = 0.0
+        uy = 0.0
+
+    # tether tension + winch pulse, scaled by attachment (no branches)
+    att = 0.0 if released else 1.0
+    stretch = dist - L0
+    tension = att * max(k * max(stretch, 0.0) + c * ((vpx - vnx) * ux + (vpy - vny) * uy), 0.0)
+    w = att * F_max if t < t_winch_off else 0.0
+    fx = -w * uy
+    fy = w * ux
+
+    # integrate motion
+    vnx += tension * ux / m_node * dt
+    vny += tension * uy / m_node * dt
+    vpx += (fx - tension * ux) / m_payload * dt
+    vpy += (fy - tension * uy) / m_payload * dt
+    rnx += vnx * dt
+    rny += vny * dt
+    rpx += vpx * dt
+    rpy += vpy * dt
+
+    # gravity gradient (payload "down", node reacts)
+    if enable_gravity:
+        vpy -= g * dt
+        vny += g * dt * (m_payload / m_node)
+
+    # EDT reboost toward origin after release
+    if enable_electro and released:
+        s = F_reboost / m_node * dt / (math.sqrt(rnx * rnx + rny * rny) + 1e-9)
+        vnx -= s * rnx
+        vny -= s * rny
+
+    return rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, released, tension
+
+
+@njit(cache=True, fastmath=True)
+def energy_terms(rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, m_node, m_payload, k, L0):
+    """Return (kinetic, tether elastic) energy of the current state."""
+    rx = rpx - rnx
+    ry = rpy - rny
+    stretch = max(math.sqrt(rx * rx + ry * ry) - L0, 0.0)
+    kinetic = 0.5 * m_node * (vnx * vnx + vny * vny) + \
+        0.5 * m_payload * (vpx * vpx + vpy * vpy)
+    return kinetic, 0.5 * k * stretch ** 2
+
+
+@njit(cache=True, fastmath=True)
+def simulate(rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, params_tuple, released,
+             record_energy, pos_n, pos_p, tension, energy):
+    """Run the whole trajectory in one compiled loop.
+
+    Writes row i of the preallocated pos_n / pos_p (N, 2), tension (N,) and
+    energy (N, 3) [t, kinetic, tether elastic] buffers after each step.
+
+    Returns the final (rnx, rny, vnx, vny, rpx, rpy, vpx, vpy) followed by
+    (released, i_release); i_release is -1 if release did not happen inside
+    this run.
+    """
+    m_node = params_tuple[0]
+    m_payload = params_tuple[1]
+    L0 = params_tuple[2]
+    k = params_tuple[3]
+    dt = params_tuple[5]
+
+    i_release = -1
+    for i in range(pos_n.shape[0]):
+        t = i * dt
+        was_released = released
+        rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, released, T = step(
+            rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, params_tuple, t, released)
+        if released and not was_released:
+            i_release = i
+
+        pos_n[i, 0] = rnx
+        pos_n[i, 1] = rny
+        pos_p[i, 0] = rpx
+        pos_p[i, 1] = rpy
+        tension[i] = T
+
+        if record_energy:
+            kinetic, elastic = energy_terms(rnx, rny, vnx, vny, rpx, rpy, vpx, vpy,
+                                            m_node, m_payload, k, L0)
+            energy[i, 0] = t
+            energy[i, 1] = kinetic
+            energy[i, 2] = elastic
+        else:
+            energy[i, 0] = 0.0
+            energy[i, 1] = 0.0
+            energy[i, 2] = 0.0
+
+    return rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, released, i_release
+
+
+@njit(cache=True, parallel=True)
+def step_batch(state, released, tension, columns, shared, t):
+    """Advance M independent trajectories by one dt, in place.
+
+    state is (8, M) with rows (rnx, rny, vnx, vny, rpx, rpy, vpx, vpy);
+    columns is (6, M) with rows (m_node, m_payload, L0, k, c, release_time);
+    released / tension are length M.
+    shared = (dt, F_winch_max, t_winch_off, g, enable_gravity,
+              F_reboost, enable_electrodynamic)
+
+    Each column goes through the same step() as TetherSystem.full_step.
+    """
+    dt, F_max, t_winch_off, g, enable_gravity, F_reboost, enable_electro = shared
+    for m in prange(state.shape[1]):
+        params_tuple = (columns[0, m], columns[1, m], columns[2, m], columns[3, m],
+                        columns[4, m], dt, columns[5, m], F_max, t_winch_off,
+                        g, enable_gravity, F_reboost, enable_electro)
+        rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, rel, T = step(
+            state[0, m], state[1, m], state[2, m], state[3, m],
+            state[4, m], state[5, m], state[6, m], state[7, m],
+            params_tuple, t, released[m])
+        state[0, m] = rnx
+        state[1, m] = rny
+        state[2, m] = vnx
+        state[3, m] = vny
+        state[4, m] = rpx
+        state[5, m] = rpy
+        state[6, m] = vpx
+        state[7, m] = vpy
+        released[m] = rel
+        tension[m] = T
+
+
+@njit(cache=True, parallel=True)
+def simulate_batch(state, released, columns, shared, record_energy,
+                   pos_n, pos_p, tension, energy, i_release):
+    """Run M whole trajectories, one simulate() call per column, in parallel.
+
+    Same state / columns / shared layout as step_batch. Fills column m of the
+    (N, M, 2) pos_n / pos_p, (N, M) tension and (N, M, 3) energy buffers,
+    updates state / released in place and writes the release step index
+    (-1 if none) to i_release[m].
+    """
+    dt, F_max, t_winch_off, g, enable_gravity, F_reboost, enable_electro = shared
+    for m in prange(state.shape[1]):
+        params_tuple = (columns[0, m], columns[1, m], columns[2, m], columns[3, m],
+                        columns[4, m], dt, columns[5, m], F_max, t_winch_off,
+                        g, enable_gravity, F_reboost, enable_electro)
+        rnx, rny, vnx, vny, rpx, rpy, vpx, vpy, rel, i_rel = simulate(
+            state[0, m], state[1, m], state[2, m], state[3, m],
+            state[4, m], state[5, m], state[6, m], state[7, m],
+            params_tuple, released[m], record_energy,
+            pos_n[:, m], pos_p[:, m], tension[:, m], energy[:, m])
+        state[0, m] = rnx
+        state[1, m] = rny
+        state[2, m] = vnx
+        state[3, m] = vny
+        state[4, m] = rpx
+        state[5, m] = rpy
+        state[6, m] = vpx
+        state[7, m] = vpy
+        released[m] = rel
+        i_release[m] = i_rel
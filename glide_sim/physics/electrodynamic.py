@@ -1,15 +1,29 @@
+import math
 import numpy as np
 
 class ElectrodynamicTether:
+    __slots__ = ("enabled", "F_reboost", "_impulse")
+
     def __init__(self, params):
         self.enabled = params.get("enable_electrodynamic", False)
         self.F_reboost = 2.0  # N constant
+        self._impulse = self.F_reboost * params["dt"]  # N*s per step; |dv| = _impulse / m_node
 
     def apply(self, tether):
         if not self.enabled or not tether.released:
             return
         # thrust back toward origin
-        dir_back = -tether.r_node / (np.linalg.norm(tether.r_node) + 1e-9)
-        F_recovery = self.F_reboost * dir_back
-        a_node = F_recovery / tether.m_node
-        tether.v_node += a_node * tether.dt
+        nx, ny = tether.rnx, tether.rny
+        inv = -self._impulse / (tether.m_node * (math.hypot(nx, ny) + 1e-9))
+        tether.vnx += inv * nx
+        tether.vny += inv * ny
+
+    def apply_batch(self, batch):
+        if not self.enabled:
+            return
+        # same thrust per trajectory, masked to the released ones
+        nx, ny = batch.rnx, batch.rny
+        inv = np.where(batch.released,
+                       -self._impulse / (batch.m_node * (np.hypot(nx, ny) + 1e-9)), 0.0)
+        batch.vnx += inv * nx
+        batch.vny += inv * ny
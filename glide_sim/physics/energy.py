@@ -1,17 +1,55 @@
+import math
 import numpy as np
 
 class EnergyTracker:
-    def __init__(self, params):
+    __slots__ = ("enabled", "log", "idx")
+
+    def __init__(self, params, n_steps=None, M=None):
         self.enabled = params.get("enable_energy", False)
-        self.log = []
+        if n_steps is None:
+            n_steps = int(round(params["t_final"] / params["dt"]))
+        # preallocated [t, kinetic, tether] rows, filled by index;
+        # pass M to hold one row per trajectory of a TetherSystemBatch
+        shape = (n_steps, 3) if M is None else (n_steps, M, 3)
+        self.log = np.zeros(shape, dtype=np.float64)
+        self.idx = 0
 
     def record(self, t, tether):
         if not self.enabled:
             return
-        v2 = 0.5*tether.m_node*np.dot(tether.v_node,tether.v_node) + \
-             0.5*tether.m_payload*np.dot(tether.v_payload,tether.v_payload)
-        e_tether = 0.5*tether.k*max(np.linalg.norm(tether.r_payload-tether.r_node)-tether.L0,0)**2
-        self.log.append([t, v2, e_tether])
+        v2 = 0.5*tether.m_node*(tether.vnx*tether.vnx + tether.vny*tether.vny) + \
+             0.5*tether.m_payload*(tether.vpx*tether.vpx + tether.vpy*tether.vpy)
+        dist = math.hypot(tether.rpx - tether.rnx, tether.rpy - tether.rny)
+        e_tether = 0.5*tether.k*max(dist-tether.L0,0)**2
+        self.record_terms(t, v2, e_tether)
+
+    def record_batch(self, t, batch):
+        # one [t, kinetic, tether] row per trajectory of a TetherSystemBatch
+        if not self.enabled:
+            return
+        v2 = 0.5*batch.m_node*(batch.vnx*batch.vnx + batch.vny*batch.vny) + \
+             0.5*batch.m_payload*(batch.vpx*batch.vpx + batch.vpy*batch.vpy)
+        dist = np.hypot(batch.rpx - batch.rnx, batch.rpy - batch.rny)
+        e_tether = 0.5*batch.k*np.maximum(dist - batch.L0, 0)**2
+        self.record_terms(t, v2, e_tether)
+
+    def record_terms(self, t, kinetic, elastic):
+        # write the next [t, kinetic, tether] row from precomputed terms
+        # (length-M arrays for a batch log); callers check enabled
+        row = self.log[self.idx]
+        row[..., 0] = t
+        row[..., 1] = kinetic
+        row[..., 2] = elastic
+        self.idx += 1
+
+    def pending(self, n):
+        # the next n rows, for a kernel to fill in place (see mark_recorded)
+        return self.log[self.idx:self.idx + n]
+
+    def mark_recorded(self, n):
+        # account for n rows filled in place through pending()
+        if self.enabled:
+            self.idx += n
 
     def snapshot(self):
-        return self.log[-1] if self.log else [0,0,0]
+        return self.log[self.idx-1] if self.idx else np.zeros(self.log.shape[1:])
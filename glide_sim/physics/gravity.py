@@ -1,14 +1,18 @@
-import numpy as np
-
 class GravityField:
+    __slots__ = ("enabled", "g", "_dv_payload_y", "_g_dt")
+
     def __init__(self, params):
         self.enabled = params.get("enable_gravity", False)
         self.g = 8.7e-3  # m/s^2 differential accel typical in LEO
 
+        # loop-invariant per-step velocity kicks (y only; x lane is zero);
+        # the node kick is g*dt times the tether's cached m_payload/m_node
+        self._dv_payload_y = -self.g * params["dt"]
+        self._g_dt = self.g * params["dt"]
+
     def apply(self, tether):
         if not self.enabled:
             return
         # apply simple gradient: pulls payload "down"
-        gravity_vec = np.array([0.0, -self.g])
-        tether.v_payload += gravity_vec * tether.dt
-        tether.v_node -= gravity_vec * tether.dt * (tether.m_payload / tether.m_node)
+        tether.vpy += self._dv_payload_y
+        tether.vny += self._g_dt * tether.mass_ratio
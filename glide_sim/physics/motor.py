@@ -1,12 +1,24 @@
 import numpy as np
 
 class WinchMotor:
+    __slots__ = ("F_max", "t_off", "_zero")
+
     def __init__(self, params):
         self.F_max = params["F_winch_max"]
+        self.t_off = 5.0  # [s] end of winch pulse
+        self._zero = np.zeros(2)  # shared, read-only
+        self._zero.flags.writeable = False
 
     def get_force(self, t, tangent):
         # simple pulse before release
-        if t < 5.0:
+        if t < self.t_off:
             return self.F_max * tangent
         else:
-            return np.zeros(2)
+            return self._zero
+
+    def get_force_xy(self, t, tx, ty):
+        # scalar form of get_force for a single tether (no array per call)
+        if t < self.t_off:
+            return self.F_max * tx, self.F_max * ty
+        else:
+            return 0.0, 0.0
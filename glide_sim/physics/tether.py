@@ -1,6 +1,16 @@
+import math
 import numpy as np
+from physics._kernels import step, energy_terms, simulate, step_batch, simulate_batch
 
 class TetherSystem:
+    # fixed attribute layout: no per-instance __dict__ on the hot path
+    __slots__ = (
+        "m_node", "m_payload", "mass_ratio", "L0", "k", "c", "dt",
+        "released", "release_time",
+        "rnx", "rny", "rpx", "rpy", "vnx", "vny", "vpx", "vpy",
+        "current_tension", "_kernel_params", "_kernel_owners",
+    )
+
     def __init__(self, params):
         self.m_node = params["m_node"]
         self.m_payload = params["m_payload"]
@@ -10,13 +20,33 @@ class TetherSystem:
         self.dt = params["dt"]
         self.released = False
         self.release_time = params["release_time"]
+        self.mass_ratio = self.m_payload / self.m_node  # node reaction to payload kicks
 
-        # initial state
-        self.r_node = np.array([0.0, 0.0])
-        self.r_payload = np.array([self.L0, 0.0])
-        self.v_node = np.zeros(2)
-        self.v_payload = np.zeros(2)
+        # initial state (SoA scalars: no 2-element ndarray temporaries per step)
+        self.rnx, self.rny = 0.0, 0.0
+        self.rpx, self.rpy = float(self.L0), 0.0
+        self.vnx, self.vny = 0.0, 0.0
+        self.vpx, self.vpy = 0.0, 0.0
         self.current_tension = 0.0
+        self._kernel_params = None
+        self._kernel_owners = None
+
+    # array views for plotting / diagnostics (built on request only)
+    @property
+    def r_node(self):
+        return np.array([self.rnx, self.rny])
+
+    @property
+    def r_payload(self):
+        return np.array([self.rpx, self.rpy])
+
+    @property
+    def v_node(self):
+        return np.array([self.vnx, self.vny])
+
+    @property
+    def v_payload(self):
+        return np.array([self.vpx, self.vpy])
 
     def update(self, t, motor):
         # 1️⃣ Check for release first (before computing forces)
@@ -25,33 +55,223 @@ class TetherSystem:
             print(f"[{t:.2f}s] Tether Released")
 
         # 2️⃣ Compute relative geometry
-        r_rel = self.r_payload - self.r_node
-        dist = np.linalg.norm(r_rel)
-        u = r_rel / dist if dist != 0 else np.zeros(2)
-
-        # 3️⃣ Force setup based on tether state
-        if not self.released:
-            stretch = dist - self.L0
-            tension = self.k * max(stretch, 0) + self.c * np.dot(self.v_payload - self.v_node, u)
-            tension = max(tension, 0)
-            self.current_tension = tension
-
-            tangent = np.array([-u[1], u[0]])
-            F_ext_payload = motor.get_force(t, tangent)
-        else:
-            tension = 0.0
-            self.current_tension = 0.0
-            F_ext_payload = np.zeros(2)
-
-        # 4️⃣ Apply tether forces if attached
-        F_tether_payload = -tension * u if not self.released else np.zeros(2)
-        F_tether_node = tension * u if not self.released else np.zeros(2)
-
-        # 5️⃣ Integrate motion
-        a_node = F_tether_node / self.m_node
-        a_payload = (F_tether_payload + F_ext_payload) / self.m_payload
-
-        self.v_node += a_node * self.dt
-        self.v_payload += a_payload * self.dt
-        self.r_node += self.v_node * self.dt
-        self.r_payload += self.v_payload * self.dt
+        rx = self.rpx - self.rnx
+        ry = self.rpy - self.rny
+        dist = math.hypot(rx, ry)
+        ux, uy = (rx / dist, ry / dist) if dist != 0 else (0.0, 0.0)
+
+        # 3️⃣ Force setup, scaled by tether state (no branches)
+        att = 0.0 if self.released else 1.0
+        stretch = dist - self.L0
+        tension = att * max(self.k * max(stretch, 0) + self.c * ((self.vpx - self.vnx)*ux + (self.vpy - self.vny)*uy), 0.0)
+        self.current_tension = tension
+
+        fx, fy = motor.get_force_xy(t, -uy, ux)
+        fx *= att
+        fy *= att
+
+        # 4️⃣ Apply tether forces and integrate motion (tension is 0 once released)
+        dt = self.dt
+        self.vnx += tension*ux / self.m_node * dt
+        self.vny += tension*uy / self.m_node * dt
+        self.vpx += (fx - tension*ux) / self.m_payload * dt
+        self.vpy += (fy - tension*uy) / self.m_payload * dt
+        self.rnx += self.vnx * dt
+        self.rny += self.vny * dt
+        self.rpx += self.vpx * dt
+        self.rpy += self.vpy * dt
+
+    def step_into(self, i, buffers):
+        # write current state straight into row i of the preallocated buffers
+        buffers["r_node"][i, 0] = self.rnx
+        buffers["r_node"][i, 1] = self.rny
+        buffers["r_payload"][i, 0] = self.rpx
+        buffers["r_payload"][i, 1] = self.rpy
+        buffers["tension"][i] = self.current_tension
+
+    def _params_tuple(self, motor, gravity, electro):
+        # constants snapshot handed to the compiled kernels; rebuilt whenever
+        # different subsystem objects are passed in
+        owners = (motor, gravity, electro)
+        if owners != self._kernel_owners:
+            self._kernel_owners = owners
+            self._kernel_params = (
+                float(self.m_node), float(self.m_payload), float(self.L0),
+                float(self.k), float(self.c), float(self.dt),
+                float(self.release_time), float(motor.F_max), float(motor.t_off),
+                float(gravity.g), bool(gravity.enabled),
+                float(electro.F_reboost), bool(electro.enabled),
+            )
+        return self._kernel_params
+
+    def _state(self):
+        return (self.rnx, self.rny, self.vnx, self.vny,
+                self.rpx, self.rpy, self.vpx, self.vpy)
+
+    def full_step(self, t, motor, gravity, electro, energy):
+        # one fused pass: tether + gravity + EDT forces and a single
+        # integration in the compiled kernel, then the energy row
+        (self.rnx, self.rny, self.vnx, self.vny,
+         self.rpx, self.rpy, self.vpx, self.vpy,
+         released, self.current_tension) = step(
+            *self._state(), self._params_tuple(motor, gravity, electro),
+            float(t), self.released)
+        if released and not self.released:
+            print(f"[{t:.2f}s] Tether Released")
+        self.released = released
+
+        if energy.enabled:
+            kinetic, elastic = energy_terms(
+                *self._state(), float(self.m_node), float(self.m_payload),
+                float(self.k), float(self.L0))
+            energy.record_terms(t, kinetic, elastic)
+
+    def simulate_into(self, motor, gravity, electro, buffers, energy):
+        # whole trajectory in one compiled call; fills every row of buffers
+        # and, if enabled, the matching rows of the energy log
+        n = len(buffers["tension"])
+        (self.rnx, self.rny, self.vnx, self.vny,
+         self.rpx, self.rpy, self.vpx, self.vpy,
+         released, i_release) = simulate(
+            *self._state(), self._params_tuple(motor, gravity, electro),
+            self.released, bool(energy.enabled), buffers["r_node"],
+            buffers["r_payload"], buffers["tension"], energy.pending(n))
+        energy.mark_recorded(n)
+        if i_release >= 0:
+            print(f"[{i_release * self.dt:.2f}s] Tether Released")
+        self.released = released
+        self.current_tension = float(buffers["tension"][-1]) if len(buffers["tension"]) else 0.0
+
+
+class TetherSystemBatch:
+    """M independent TetherSystem trajectories advanced together (parameter sweeps).
+
+    Any of m_node, m_payload, L0, k_tether, c_damp, release_time in params may
+    be a length-M sequence; scalars are broadcast to all M trajectories. The
+    state lives in one (8, M) array and the swept parameters in one (6, M)
+    array; rnx ... vpy and m_node ... release_time are length-M row views,
+    in the kernel argument order.
+
+    update() applies the TetherSystem update to all M trajectories with
+    vectorized NumPy ops, the per-trajectory release state being a boolean
+    mask rather than a branch; GravityField.apply,
+    ElectrodynamicTether.apply_batch and EnergyTracker.record_batch complete
+    the NumPy step. full_step() / simulate_into() run every column through the
+    same compiled step / simulate kernels as TetherSystem.
+    """
+
+    def __init__(self, params, M):
+        self.M = int(M)
+        self.dt = params["dt"]
+
+        # swept parameters, one column per trajectory
+        self.columns = np.empty((6, self.M))
+        for row, key in zip(self.columns, ("m_node", "m_payload", "L0",
+                                           "k_tether", "c_damp", "release_time")):
+            row[:] = np.broadcast_to(np.asarray(params[key], dtype=float), (self.M,))
+        (self.m_node, self.m_payload, self.L0,
+         self.k, self.c, self.release_time) = self.columns
+        self.mass_ratio = self.m_payload / self.m_node
+        self.released = np.zeros(self.M, dtype=bool)
+
+        # initial state, one column per trajectory
+        self.state = np.zeros((8, self.M))
+        (self.rnx, self.rny, self.vnx, self.vny,
+         self.rpx, self.rpy, self.vpx, self.vpy) = self.state
+        self.rpx[:] = self.L0
+        self.current_tension = np.zeros(self.M)
+        self._kernel_shared = None
+        self._kernel_owners = None
+
+    @property
+    def r_node(self):
+        return np.column_stack((self.rnx, self.rny))
+
+    @property
+    def r_payload(self):
+        return np.column_stack((self.rpx, self.rpy))
+
+    def update(self, t, motor):
+        # 1️⃣ Release mask (per trajectory)
+        newly = ~self.released & (t >= self.release_time)
+        if newly.any():
+            self.released |= newly
+            print(f"[{t:.2f}s] Tether Released ({int(newly.sum())}/{self.M})")
+        attached = ~self.released
+
+        # 2️⃣ Compute relative geometry
+        rx = self.rpx - self.rnx
+        ry = self.rpy - self.rny
+        dist = np.sqrt(rx*rx + ry*ry)
+        safe = np.where(dist != 0, dist, 1.0)
+        ux = np.where(dist != 0, rx / safe, 0.0)
+        uy = np.where(dist != 0, ry / safe, 0.0)
+
+        # 3️⃣ Force setup, masked by tether state
+        stretch = dist - self.L0
+        tension = self.k * np.maximum(stretch, 0) + self.c * ((self.vpx - self.vnx)*ux + (self.vpy - self.vny)*uy)
+        tension = np.where(attached, np.maximum(tension, 0), 0.0)
+        self.current_tension = tension
+
+        F_ext = motor.get_force(t, np.column_stack((-uy, ux)))
+        fx = np.where(attached, F_ext[..., 0], 0.0)
+        fy = np.where(attached, F_ext[..., 1], 0.0)
+
+        # 4️⃣ Integrate motion (in place: rnx ... vpy are views into state)
+        dt = self.dt
+        self.vnx += tension*ux / self.m_node * dt
+        self.vny += tension*uy / self.m_node * dt
+        self.vpx += (fx - tension*ux) / self.m_payload * dt
+        self.vpy += (fy - tension*uy) / self.m_payload * dt
+        self.rnx += self.vnx * dt
+        self.rny += self.vny * dt
+        self.rpx += self.vpx * dt
+        self.rpy += self.vpy * dt
+
+    def step_into(self, i, buffers):
+        # row i of (N, M, 2) / (N, M) buffers
+        buffers["r_node"][i, :, 0] = self.rnx
+        buffers["r_node"][i, :, 1] = self.rny
+        buffers["r_payload"][i, :, 0] = self.rpx
+        buffers["r_payload"][i, :, 1] = self.rpy
+        buffers["tension"][i] = self.current_tension
+
+    def _shared_tuple(self, motor, gravity, electro):
+        # batch-wide constants for the compiled kernels; rebuilt whenever
+        # different subsystem objects are passed in
+        owners = (motor, gravity, electro)
+        if owners != self._kernel_owners:
+            self._kernel_owners = owners
+            self._kernel_shared = (
+                float(self.dt), float(motor.F_max), float(motor.t_off),
+                float(gravity.g), bool(gravity.enabled),
+                float(electro.F_reboost), bool(electro.enabled),
+            )
+        return self._kernel_shared
+
+    def full_step(self, t, motor, gravity, electro, energy):
+        # TetherSystem.full_step for every trajectory: tether + gravity + EDT
+        # in the compiled kernel, then one energy row per trajectory
+        was_released = self.released.copy()
+        step_batch(self.state, self.released, self.current_tension, self.columns,
+                   self._shared_tuple(motor, gravity, electro), float(t))
+        newly = self.released & ~was_released
+        if newly.any():
+            print(f"[{t:.2f}s] Tether Released ({int(newly.sum())}/{self.M})")
+        energy.record_batch(t, self)
+
+    def simulate_into(self, motor, gravity, electro, buffers, energy):
+        # whole sweep in one compiled call; buffers are (N, M, 2) / (N, M),
+        # energy is an EnergyTracker built with M
+        n = len(buffers["tension"])
+        i_release = np.full(self.M, -1, dtype=np.int64)
+        simulate_batch(self.state, self.released, self.columns,
+                       self._shared_tuple(motor, gravity, electro),
+                       bool(energy.enabled), buffers["r_node"], buffers["r_payload"],
+                       buffers["tension"], energy.pending(n), i_release)
+        energy.mark_recorded(n)
+        for i in np.unique(i_release[i_release >= 0]):
+            print(f"[{i * self.dt:.2f}s] Tether Released "
+                  f"({int((i_release == i).sum())}/{self.M})")
+        self.current_tension = (buffers["tension"][-1].copy() if len(buffers["tension"])
+                                else np.zeros(self.M))
@@ -1,45 +1,63 @@
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
 class GlideAnimator:
     def __init__(self, tether, node_traj, payload_traj, params):
         self.tether = tether
-        self.node_traj = node_traj
-        self.payload_traj = payload_traj
+        # (N, 2) trajectory buffers from main.py, used as-is (no list conversion)
+        self.node_traj = np.asarray(node_traj)
+        self.payload_traj = np.asarray(payload_traj)
         self.params = params
 
+        # reusable artist data (filled in place every frame)
+        self._lx = np.empty(2)
+        self._ly = np.empty(2)
+        self._empty = np.empty(0)
+        self._node_xy = np.empty(2)
+        self._payload_xy = np.empty(2)
+
     def run(self):
         fig, ax = plt.subplots(figsize=(8, 6))
         ax.set_xlim(-self.params["L0"] * 1.5, self.params["L0"] * 1.5)
         ax.set_ylim(-self.params["L0"] * 0.5, self.params["L0"] * 1.5)
         ax.set_aspect("equal")
 
-        line_tether, = ax.plot([], [], "-", color="gray")
-        dot_node, = ax.plot([], [], "o", color="orange", markersize=10)
-        dot_payload, = ax.plot([], [], "o", color="lime", markersize=8)
-        time_text = ax.text(0.02, 0.95, "", transform=ax.transAxes)
+        line_tether, = ax.plot([], [], "-", color="gray", animated=True)
+        dot_node, = ax.plot([], [], "o", color="orange", markersize=10, animated=True)
+        dot_payload, = ax.plot([], [], "o", color="lime", markersize=8, animated=True)
+        time_text = ax.text(0.02, 0.95, "", transform=ax.transAxes, animated=True)
         status_text = ax.text(0.5, 0.9, "", transform=ax.transAxes,
                               ha="center", va="center",
-                              color="red", fontsize=12, weight="bold")
+                              color="red", fontsize=12, weight="bold",
+                              animated=True)
 
         release_time = self.params.get("release_time", 5.0)
         dt = self.params.get("dt", 0.01)
 
         def update(frame):
-            xN, yN = self.node_traj[frame]
-            xP, yP = self.payload_traj[frame]
+            xN = self.node_traj[frame, 0]
+            yN = self.node_traj[frame, 1]
+            xP = self.payload_traj[frame, 0]
+            yP = self.payload_traj[frame, 1]
             t_now = frame * dt
 
             # Hide the tether line after release
             if t_now >= release_time:
-                line_tether.set_data([], [])
+                line_tether.set_data(self._empty, self._empty)
                 status_text.set_text("TETHER RELEASED — Momentum Exchange Complete")
             else:
-                line_tether.set_data([xN, xP], [yN, yP])
+                self._lx[0] = xN
+                self._lx[1] = xP
+                self._ly[0] = yN
+                self._ly[1] = yP
+                line_tether.set_data(self._lx, self._ly)
                 status_text.set_text("")
 
-            dot_node.set_data([xN], [yN])
-            dot_payload.set_data([xP], [yP])
+            self._node_xy[:] = xN, yN
+            self._payload_xy[:] = xP, yP
+            dot_node.set_data(self._node_xy[:1], self._node_xy[1:])
+            dot_payload.set_data(self._payload_xy[:1], self._payload_xy[1:])
             time_text.set_text(f"t = {t_now:.2f}s")
 
             return line_tether, dot_node, dot_payload, time_text, status_text
@@ -49,7 +67,7 @@ class GlideAnimator:
             update,
             frames=len(self.node_traj),
             interval=10,
-            blit=False,
+            blit=True,
             repeat=False
         )
 
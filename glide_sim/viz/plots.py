@@ -2,14 +2,15 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 class DiagnosticPlots:
-    def __init__(self, tether, energy_log, tension_log, params):
-        self.energy = np.array(energy_log)
-        self.tension = np.array(tension_log)
+    def __init__(self, tether, times, energy_log, tension_log, params):
+        self.t = np.asarray(times)
+        self.energy = np.asarray(energy_log)
+        self.tension = np.asarray(tension_log)
         self.params = params
 
     def show(self):
         fig, ax = plt.subplots(2,1,figsize=(8,6))
-        t = np.arange(0, self.params["t_final"], self.params["dt"])
+        t = self.t
         if len(self.energy)>0:
             ax[0].plot(t[:len(self.energy)], self.energy[:,1], label='Kinetic')
             ax[0].plot(t[:len(self.energy)], self.energy[:,2], label='Tether')
@@ -4,6 +4,7 @@
 # ============================================================
 
 from __future__ import annotations
+import math
 import numpy as np
 
 
@@ -66,7 +67,7 @@ class ElectrodynamicTether:
         self.I = float(np.clip(current_cmd, -1.0, 1.0)) * self.I_max
 
         L_vec2 = np.asarray(payload_pos, dtype=float) - np.asarray(node_pos, dtype=float)
-        L_norm = float(np.linalg.norm(L_vec2))
+        L_norm = math.hypot(L_vec2[0], L_vec2[1])
         if L_norm < 1e-9:
             self.F[:] = 0.0
             self.P_loss = (self.I ** 2) * self.R_tether
@@ -86,7 +87,7 @@ class ElectrodynamicTether:
         v = np.asarray(velocity_vec, dtype=float)
         P_candidate = float(np.dot(F_candidate, v))
 
-        if np.linalg.norm(v) > 1e-9:
+        if math.hypot(v[0], v[1]) > 1e-9:
             if self.mode == "boost":
                 sgn = 1.0 if P_candidate >= 0 else -1.0
             else:
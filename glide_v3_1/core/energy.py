@@ -36,27 +36,22 @@ class EnergyTracker:
         dt = float(dt)
         t_next = 0.0 if not self.time else self.time[-1] + dt
 
-        v2 = np.sum(tether.velocities[1:] ** 2, axis=1)
-        kinetic = 0.5 * tether.m_segment * float(np.sum(v2))
+        # energy sums always in float64, whatever the tether storage dtype
+        v = tether.velocities[1:]
+        kinetic = 0.5 * tether.m_segment * float(np.einsum("ij,ij->", v, v, dtype=np.float64))
 
-        elastic = 0.0
-        for i in range(tether.N):
-            p0, p1 = tether.positions[i], tether.positions[i + 1]
-            dist = float(np.linalg.norm(p1 - p0))
-            stretch = dist - tether.segment_length
-            elastic += 0.5 * tether.k * (stretch * stretch)
+        pos = np.asarray(tether.positions, dtype=np.float64)
+        diffs = pos[1:] - pos[:-1]
+        stretch = np.sqrt(np.einsum("ij,ij->i", diffs, diffs)) - tether.segment_length
+        elastic = 0.5 * tether.k * float(np.dot(stretch, stretch))
 
         grav = 0.0
         if gravity is not None:
             if getattr(gravity, "mode", "local") == "local":
-                y_ref = float(tether.positions[0, 1])
-                for i in range(1, tether.N + 1):
-                    grav += tether.m_segment * gravity.g0 * (float(tether.positions[i, 1]) - y_ref)
+                grav = tether.m_segment * gravity.g0 * float(np.sum(pos[1:, 1] - pos[0, 1]))
             else:
-                U_ref = float(gravity.get_potential(tether.positions[0]))
-                for i in range(1, tether.N + 1):
-                    Ui = float(gravity.get_potential(tether.positions[i]))
-                    grav += tether.m_segment * (Ui - U_ref)
+                U = gravity.get_potential(pos)
+                grav = tether.m_segment * float(np.sum(U[1:] - U[0]))
 
         P_motor = float(getattr(motor, "P_elec", 0.0))
         P_edt = float(edt.get_power())
@@ -34,11 +34,23 @@ class GravityField:
         self.mode = str(mode).lower().strip()
 
     def get_acceleration(self, position: np.ndarray) -> np.ndarray:
+        """Acceleration at a (2,) position, or (N, 2) for (N, 2) positions."""
         pos = np.asarray(position, dtype=float)
 
         if self.mode == "local":
+            if pos.ndim == 2:
+                acc = np.zeros_like(pos)
+                acc[:, 1] = -self.g0
+                return acc
             return np.array([0.0, -self.g0], dtype=float)
 
+        if pos.ndim == 2:
+            r2 = np.einsum("ij,ij->i", pos, pos)
+            acc = np.zeros_like(pos)
+            far = r2 >= 1.0
+            acc[far] = -self.mu * pos[far] / (r2[far] * np.sqrt(r2[far]))[:, None]
+            return acc
+
         # Orbital (two-body) about origin
         r2 = float(np.dot(pos, pos))
         if r2 < 1.0:
@@ -47,13 +59,23 @@ class GravityField:
         r = float(np.sqrt(r2))
         return -self.mu * pos / (r ** 3)
 
-    def get_potential(self, position: np.ndarray) -> float:
+    def get_potential(self, position: np.ndarray) -> float | np.ndarray:
+        """Potential per unit mass at a (2,) position, or (N,) for (N, 2) positions."""
         pos = np.asarray(position, dtype=float)
 
         if self.mode == "local":
             # Potential per unit mass up to a constant: U = g*y
+            if pos.ndim == 2:
+                return self.g0 * pos[:, 1]
             return self.g0 * float(pos[1])
 
+        if pos.ndim == 2:
+            r2 = np.einsum("ij,ij->i", pos, pos)
+            U = np.zeros(len(pos), dtype=float)
+            far = r2 >= 1.0
+            U[far] = -self.mu / np.sqrt(r2[far])
+            return U
+
         r2 = float(np.dot(pos, pos))
         if r2 < 1.0:
             return 0.0
@@ -11,6 +11,7 @@ from core.motor import MotorSystem
 from core.gravity import GravityField
 from core.edt import ElectrodynamicTether
 from core.energy import EnergyTracker
+from utils.config import GLIDEConfig
 
 
 class GLIDEIntegrator:
@@ -22,56 +23,57 @@ class GLIDEIntegrator:
       • Gravity applied consistently to ALL nodes
     """
 
-    def __init__(self, config: dict):
-        self.config = dict(config)
-        self.dt = float(self.config.get("dt", 0.01))
+    def __init__(self, config: GLIDEConfig):
+        self.config = config
+        self.dt = float(self.config.dt)
 
         self.anchor_pos = np.array([0.0, 0.0], dtype=float)
         self.anchor_vel = np.zeros(2, dtype=float)
 
-        self.gravity_mode = str(self.config.get("gravity_mode", "local")).lower().strip()
-        self.local_g = float(self.config.get("local_g", 9.80665))
+        self.gravity_mode = str(self.config.gravity_mode).lower().strip()
+        self.local_g = float(self.config.local_g)
         self.gravity = GravityField(
             mode=self.gravity_mode,
             g0=self.local_g,
-            mu=float(self.config.get("mu", 3.986004418e14)),
-            R_earth=float(self.config.get("R_earth", 6.371e6)),
+            mu=float(self.config.mu),
+            R_earth=float(self.config.R_earth),
         )
 
         self.tether = DynamicTether(
-            N=int(self.config.get("N", 25)),
-            L0=float(self.config.get("L0", 200.0)),
-            E=float(self.config.get("E", 30e9)),
-            d=float(self.config.get("d", 0.005)),
-            rho_l=float(self.config.get("rho_l", 1.5)),
-            damping_ratio=float(self.config.get("tether_damping_ratio", 0.05)),
-            numerical_vel_decay_per_s=float(self.config.get("numerical_vel_decay_per_s", 0.0)),
+            N=int(self.config.N),
+            L0=float(self.config.L0),
+            E=float(self.config.E),
+            d=float(self.config.d),
+            rho_l=float(self.config.rho_l),
+            damping_ratio=float(self.config.tether_damping_ratio),
+            numerical_vel_decay_per_s=float(self.config.numerical_vel_decay_per_s),
+            dtype=np.dtype(self.config.tether_dtype),
         )
 
         self.motor = MotorSystem(
-            R_spool=float(self.config.get("R_spool", 0.25)),
-            J_m=float(self.config.get("J_m", 0.08)),
-            tau_max=float(self.config.get("tau_max", 15.0)),
-            b_m=float(self.config.get("b_m", 0.02)),
-            eta=float(self.config.get("eta", 0.87)),
+            R_spool=float(self.config.R_spool),
+            J_m=float(self.config.J_m),
+            tau_max=float(self.config.tau_max),
+            b_m=float(self.config.b_m),
+            eta=float(self.config.eta),
         )
 
         self.edt = ElectrodynamicTether(
-            L=float(self.config.get("EDT_L", 100.0)),
-            B_vec=np.array(self.config.get("B_vec", [0.0, 0.0, 3.1e-5]), dtype=float),
-            R_tether=float(self.config.get("EDT_R", 50.0)),
-            I_max=float(self.config.get("EDT_Imax", 2.5)),
-            mode=str(self.config.get("EDT_mode", "off")),
+            L=float(self.config.EDT_L),
+            B_vec=np.array(self.config.B_vec, dtype=float),
+            R_tether=float(self.config.EDT_R),
+            I_max=float(self.config.EDT_Imax),
+            mode=str(self.config.EDT_mode),
         )
 
         self.energy = EnergyTracker(
-            battery_capacity_J=float(self.config.get("battery_capacity_J", 5e5)),
-            log_interval_s=float(self.config.get("log_interval", 1.0)),
+            battery_capacity_J=float(self.config.battery_capacity_J),
+            log_interval_s=float(self.config.log_interval),
         )
 
-        self.constraint_iterations = int(self.config.get("constraint_iterations", 3))
-        self.max_substep_dt = float(self.config.get("tether_max_substep_dt", 0.005))
-        self.velocity_limit = float(self.config.get("velocity_limit", 0.0))  # 0 disables
+        self.constraint_iterations = int(self.config.constraint_iterations)
+        self.max_substep_dt = float(self.config.tether_max_substep_dt)
+        self.velocity_limit = float(self.config.velocity_limit)  # 0 disables
 
         self.step_count = 0
 
@@ -82,25 +84,29 @@ class GLIDEIntegrator:
         F_ext = np.zeros_like(self.tether.positions)
 
         # Gravity on all non-anchor nodes
-        for i in range(1, self.tether.N + 1):
-            a_g = self._gravity_accel(self.tether.positions[i])
-            F_ext[i] += self.tether.m_segment * a_g
+        if self.gravity.mode == "local":
+            F_ext[1:, 1] -= self.tether.m_segment * self.gravity.g0
+        else:
+            F_ext[1:] += self.tether.m_segment * self._gravity_accel(self.tether.positions[1:])
 
         # EDT on payload only
-        payload_pos, payload_vel = self.tether.get_payload_state()
+        payload_pos, payload_vel = self.tether.payload_view()
         F_edt = self.edt.update(self.anchor_pos, payload_pos, payload_vel, current_cmd)
         F_ext[-1] += F_edt
 
         return F_ext
 
+    def _clear_nans(self):
+        if np.isnan(self.tether.positions).any() or np.isnan(self.tether.velocities).any():
+            np.nan_to_num(self.tether.positions, copy=False)
+            np.nan_to_num(self.tether.velocities, copy=False)
+
     def step(self, omega_cmd: float = 0.0, current_cmd: float = 0.0):
         # Apply anchor boundary condition
         self.tether.anchor_update(self.anchor_pos, self.anchor_vel)
 
-        # Internal forces
-        self.tether.compute_internal_forces()
-
-        # Motor update at control rate
+        # Motor update at control rate (tension profile is geometric; forces
+        # are computed inside each substep)
         tensions = self.tether.get_tension_profile()
         T_tip = float(tensions[-1]) if len(tensions) else 0.0
         v_anchor_vertical = float(self.motor.update(self.dt, T_tip, omega_cmd))
@@ -112,26 +118,28 @@ class GLIDEIntegrator:
         n_sub = max(1, int(np.ceil(dt / dt_sub)))
         dt_sub = dt / n_sub
 
-        for _ in range(n_sub):
-            self.anchor_pos += self.anchor_vel * dt_sub
-            self.tether.anchor_update(self.anchor_pos, self.anchor_vel)
-
-            self.tether.compute_internal_forces()
+        # Local gravity with the EDT off and no velocity clamp: the external
+        # forces cannot change between substeps, so run them all in one call
+        if self.gravity.mode == "local" and self.edt.mode == "off" and not self.velocity_limit > 0:
             F_ext = self._build_external_forces(current_cmd)
-            self.tether.add_external_forces(F_ext)
-
-            self.tether.integrate(dt_sub)
-            self.tether.enforce_constraints(dt_sub, iterations=self.constraint_iterations)
-
-            if self.velocity_limit and self.velocity_limit > 0:
-                v_mag = np.linalg.norm(self.tether.velocities, axis=1)
-                too_fast = v_mag > self.velocity_limit
-                if np.any(too_fast):
-                    self.tether.velocities[too_fast] *= (self.velocity_limit / v_mag[too_fast])[:, None]
-
-            if np.isnan(self.tether.positions).any() or np.isnan(self.tether.velocities).any():
-                self.tether.positions = np.nan_to_num(self.tether.positions)
-                self.tether.velocities = np.nan_to_num(self.tether.velocities)
+            self.tether.advance(F_ext, dt_sub, n_sub, self.anchor_pos, self.anchor_vel,
+                                iterations=self.constraint_iterations)
+            self._clear_nans()
+        else:
+            for _ in range(n_sub):
+                self.anchor_pos += self.anchor_vel * dt_sub
+                self.tether.anchor_update(self.anchor_pos, self.anchor_vel)
+
+                F_ext = self._build_external_forces(current_cmd)
+                self.tether.substep(F_ext, dt_sub, iterations=self.constraint_iterations)
+
+                if self.velocity_limit and self.velocity_limit > 0:
+                    v_mag = np.hypot(self.tether.velocities[:, 0], self.tether.velocities[:, 1])
+                    too_fast = v_mag > self.velocity_limit
+                    if np.any(too_fast):
+                        self.tether.velocities[too_fast] *= (self.velocity_limit / v_mag[too_fast])[:, None]
+
+                self._clear_nans()
 
         # Energy bookkeeping at control rate
         self.energy.update(self.dt, self.tether, self.motor, self.edt, self.gravity)
@@ -4,8 +4,11 @@
 # ============================================================
 
 from __future__ import annotations
+import math
 import numpy as np
 
+from core import tether_kernels
+
 
 class DynamicTether:
     """Multi-segment tether with spring-damper axial elements.
@@ -14,6 +17,17 @@ class DynamicTether:
       • No dt-dependent per-step damping.
       • Constraints (optional) do not inject energy (velocity recomputed from corrected positions).
       • Gravity/external fields are applied by the integrator, not here.
+
+    Precision:
+      • dtype selects the storage for positions/velocities/forces. float64 is
+        the default; float32 halves memory traffic and stays stable for the
+        preset modes, but segment stretch is a small difference of large
+        coordinates, so it is not a storage-only change: energy buckets shift
+        (E_kin by ~10% over 30 s) and, because the tip tension fed to the motor
+        and anchor comes from float32 coordinates, so does the whole trajectory
+        (local_demo at 10 s: anchor_y -0.065 m vs +0.0034 m, payload ~7 cm lower).
+      • Storage is SoA (px, py, vx, vy are contiguous 1-D arrays); positions
+        and velocities are writable (N+1, 2) views onto the same memory.
     """
 
     def __init__(
@@ -25,6 +39,7 @@ class DynamicTether:
         rho_l: float = 1.5,
         damping_ratio: float = 0.05,
         numerical_vel_decay_per_s: float = 0.0,
+        dtype=np.float64,
     ):
         self.N = int(N)
         self.L0 = float(L0)
@@ -39,63 +54,121 @@ class DynamicTether:
         self.c = 2.0 * np.sqrt(self.k * self.m_segment) * float(damping_ratio)
         self._vel_decay_per_s = max(0.0, float(numerical_vel_decay_per_s))
 
-        self.positions = np.zeros((self.N + 1, 2), dtype=float)
-        self.velocities = np.zeros((self.N + 1, 2), dtype=float)
-
-        for i in range(self.N + 1):
-            self.positions[i] = np.array([0.0, -i * self.segment_length], dtype=float)
-
-        self._forces = np.zeros_like(self.positions)
-        self._pos_prev = self.positions.copy()
+        # integrate() constants, recomputed only when the substep dt changes
+        self._cached_dt = None
+        self._kick = 0.0  # decay * dt / m_segment
+        self._decay = 1.0
+
+        # SoA storage: row 0 holds x, row 1 holds y, so each coordinate is a
+        # contiguous 1-D array; positions/velocities are (N+1, 2) views of it
+        self.dtype = np.dtype(dtype)
+        self._xy = np.zeros((2, self.N + 1), dtype=self.dtype)
+        self._vxy = np.zeros((2, self.N + 1), dtype=self.dtype)
+        self._fxy = np.zeros((2, self.N + 1), dtype=self.dtype)
+        self._prev_xy = np.zeros((2, self.N + 1), dtype=self.dtype)
+
+        self.px, self.py = self._xy
+        self.vx, self.vy = self._vxy
+        self.positions = self._xy.T
+        self.velocities = self._vxy.T
+        self._forces = self._fxy.T
+        self._pos_prev = self._prev_xy.T
+
+        # hanging straight down from the anchor
+        self.py[:] = -np.arange(self.N + 1) * self.segment_length
+        self._prev_xy[:] = self._xy
+
+        # per-segment scratch for the NumPy force path (reused every substep)
+        self._rx = np.empty(self.N, dtype=self.dtype)
+        self._ry = np.empty(self.N, dtype=self.dtype)
+        self._ux = np.empty(self.N, dtype=self.dtype)
+        self._uy = np.empty(self.N, dtype=self.dtype)
+        self._dvx = np.empty(self.N, dtype=self.dtype)
+        self._dvy = np.empty(self.N, dtype=self.dtype)
+        self._Fsx = np.empty(self.N, dtype=self.dtype)
+        self._Fsy = np.empty(self.N, dtype=self.dtype)
+        self._L = np.empty(self.N, dtype=self.dtype)
+        self._Ls = np.empty(self.N, dtype=self.dtype)
+        self._s = np.empty(self.N, dtype=self.dtype)
+        self._rel_vel = np.empty(self.N, dtype=self.dtype)
+        self._valid = np.empty(self.N, dtype=bool)
+        self._step_scratch = np.empty((2, self.N), dtype=self.dtype)
+
+        if tether_kernels.HAVE_NUMBA:
+            # compile up front so the first control step doesn't pay for it
+            tether_kernels.warmup(self.dtype)
 
     def anchor_update(self, anchor_pos: np.ndarray, anchor_vel: np.ndarray):
         self.positions[0] = np.asarray(anchor_pos, dtype=float)
         self.velocities[0] = np.asarray(anchor_vel, dtype=float)
 
     def compute_internal_forces(self) -> np.ndarray:
-        F = np.zeros_like(self.positions)
-
-        for i in range(self.N):
-            p0, p1 = self.positions[i], self.positions[i + 1]
-            v0, v1 = self.velocities[i], self.velocities[i + 1]
-
-            r = p1 - p0
-            L = float(np.linalg.norm(r))
-            if L < 1e-12:
-                continue
-
-            u = r / L
-            stretch = L - self.segment_length
-            rel_vel = float(np.dot(v1 - v0, u))
-
-            Fs = -self.k * stretch * u - self.c * rel_vel * u
-
-            F[i] += Fs
-            F[i + 1] -= Fs
-
-        self._forces = F
-        return F
+        # All N segments at once; degenerate (L < 1e-12) segments carry no force
+        px, py, vx, vy = self.px, self.py, self.vx, self.vy
+        rx, ry, ux, uy, L, s = self._rx, self._ry, self._ux, self._uy, self._L, self._s
+        np.subtract(px[1:], px[:-1], out=rx)
+        np.subtract(py[1:], py[:-1], out=ry)
+        np.hypot(rx, ry, out=L)
+        np.greater_equal(L, 1e-12, out=self._valid)
+        np.maximum(L, 1e-12, out=self._Ls)
+        np.divide(rx, self._Ls, out=ux)
+        np.divide(ry, self._Ls, out=uy)
+
+        # rel_vel = (v[i+1] - v[i]) . u
+        dvx = np.subtract(vx[1:], vx[:-1], out=self._dvx)
+        dvy = np.subtract(vy[1:], vy[:-1], out=self._dvy)
+        dvx *= ux
+        dvy *= uy
+        rel_vel = np.add(dvx, dvy, out=self._rel_vel)
+
+        # s = -k * (L - L0) - c * rel_vel, zeroed on degenerate segments
+        np.subtract(L, self.segment_length, out=s)
+        s *= -self.k
+        rel_vel *= self.c
+        s -= rel_vel
+        s *= self._valid
+        Fsx = np.multiply(ux, s, out=self._Fsx)
+        Fsy = np.multiply(uy, s, out=self._Fsy)
+
+        # segment i pushes node i by +Fs and node i+1 by -Fs
+        fx, fy = self._fxy
+        fx[:-1] = Fsx
+        fx[-1] = 0.0
+        fx[1:] -= Fsx
+        fy[:-1] = Fsy
+        fy[-1] = 0.0
+        fy[1:] -= Fsy
+        return self._forces
 
     def add_external_forces(self, F_ext: np.ndarray):
-        self._forces += np.asarray(F_ext, dtype=float)
+        # F_ext: (N+1, 2) array; added in place, cast to the storage dtype
+        np.add(self._forces, F_ext, out=self._forces)
 
     def apply_force_to_payload(self, F_ext: np.ndarray):
-        self._forces[-1] += np.asarray(F_ext, dtype=float)
+        self._fxy[0, -1] += F_ext[0]
+        self._fxy[1, -1] += F_ext[1]
+
+    def _update_dt_cache(self, dt: float):
+        if dt != self._cached_dt:
+            self._cached_dt = dt
+            self._decay = math.exp(-self._vel_decay_per_s * dt) if self._vel_decay_per_s > 0.0 else 1.0
+            self._kick = self._decay * dt / self.m_segment
 
     def integrate(self, dt: float):
         dt = float(dt)
         if dt <= 0:
             return
 
-        self._pos_prev[:] = self.positions
+        self._update_dt_cache(dt)
+        self._prev_xy[:] = self._xy
 
-        a = self._forces / self.m_segment
-
-        self.velocities[1:] += a[1:] * dt
-        self.positions[1:] += self.velocities[1:] * dt
-
-        if self._vel_decay_per_s > 0.0:
-            self.velocities[1:] *= np.exp(-self._vel_decay_per_s * dt)
+        # v = decay * (v + F * dt/m), then x += v * dt (semi-implicit); the
+        # decay rides along with the kick instead of a separate pass
+        tmp = self._step_scratch
+        if self._decay != 1.0:
+            self._vxy[:, 1:] *= self._decay
+        self._vxy[:, 1:] += np.multiply(self._fxy[:, 1:], self._kick, out=tmp)
+        self._xy[:, 1:] += np.multiply(self._vxy[:, 1:], dt, out=tmp)
 
     def enforce_constraints(self, dt: float, iterations: int = 2):
         dt = float(dt)
@@ -106,45 +179,123 @@ class DynamicTether:
         if iterations == 0:
             return
 
+        # The sweep stays sequential, anchor to tip (Gauss-Seidel: each segment
+        # sees the last update, and the tip segment is fixed last, which sets
+        # the T_tip the motor reads). Jacobi / red-black orderings change the
+        # physics, not just round-off. The per-segment work runs on plain
+        # floats, so each update is a few float ops instead of NumPy row ops.
+        x = self.px.tolist()
+        y = self.py.tolist()
+        x_anchor, y_anchor = float(self._prev_xy[0, 0]), float(self._prev_xy[1, 0])
+        L = self.segment_length
         for _ in range(iterations):
             for i in range(self.N):
-                p0, p1 = self.positions[i], self.positions[i + 1]
-                delta = p1 - p0
-                dist = float(np.linalg.norm(delta))
+                dx = x[i + 1] - x[i]
+                dy = y[i + 1] - y[i]
+                dist = math.hypot(dx, dy)
                 if dist < 1e-12:
                     continue
 
-                diff = (dist - self.segment_length) / dist
+                diff = (dist - L) / dist
 
                 if i == 0:
-                    self.positions[i + 1] -= delta * diff
+                    x[1] -= dx * diff
+                    y[1] -= dy * diff
                 else:
-                    corr = 0.5 * delta * diff
-                    self.positions[i] += corr
-                    self.positions[i + 1] -= corr
+                    cx = 0.5 * dx * diff
+                    cy = 0.5 * dy * diff
+                    x[i] += cx
+                    y[i] += cy
+                    x[i + 1] -= cx
+                    y[i + 1] -= cy
 
-            self.positions[0] = self._pos_prev[0]
+            x[0], y[0] = x_anchor, y_anchor
+        self.px[:] = x
+        self.py[:] = y
 
         # velocity recompute => stops constraint energy injection
-        self.velocities[1:] = (self.positions[1:] - self._pos_prev[1:]) / dt
+        np.subtract(self._xy[:, 1:], self._prev_xy[:, 1:], out=self._vxy[:, 1:])
+        self._vxy[:, 1:] /= dt
+
+    def substep(self, F_ext: np.ndarray, dt: float, iterations: int = 2):
+        """Forces -> integrate -> constraints for one tether substep.
+
+        Runs the compiled kernel when numba is available, otherwise the
+        equivalent NumPy methods.
+        """
+        dt = float(dt)
+        iterations = int(max(0, iterations))
+        if tether_kernels.HAVE_NUMBA:
+            self._update_dt_cache(dt)
+            F_ext = np.asarray(F_ext, dtype=float)
+            tether_kernels.substep(
+                self.px, self.py, self.vx, self.vy,
+                self._fxy[0], self._fxy[1], self._prev_xy[0], self._prev_xy[1],
+                F_ext[:, 0], F_ext[:, 1], self.k, self.c,
+                self.segment_length, dt, iterations, self._kick, self._decay,
+            )
+            return
+
+        self.compute_internal_forces()
+        self.add_external_forces(F_ext)
+        self.integrate(dt)
+        self.enforce_constraints(dt, iterations=iterations)
+
+    def advance(self, F_ext: np.ndarray, dt: float, n_sub: int,
+                anchor_pos: np.ndarray, anchor_vel: np.ndarray, iterations: int = 2):
+        """n_sub substeps of length dt with F_ext held constant.
+
+        The anchor moves at anchor_vel and is re-applied before each substep;
+        anchor_pos is advanced in place. With numba the whole loop is one
+        compiled call.
+        """
+        dt = float(dt)
+        n_sub = int(max(0, n_sub))
+        iterations = int(max(0, iterations))
+        if tether_kernels.HAVE_NUMBA:
+            self._update_dt_cache(dt)
+            F_ext = np.asarray(F_ext, dtype=float)
+            tether_kernels.step_many(
+                self.px, self.py, self.vx, self.vy,
+                self._fxy[0], self._fxy[1], self._prev_xy[0], self._prev_xy[1],
+                F_ext[:, 0], F_ext[:, 1], anchor_pos,
+                float(anchor_vel[0]), float(anchor_vel[1]),
+                self.k, self.c, self.segment_length,
+                dt, n_sub, iterations, self._kick, self._decay,
+            )
+            return
+
+        for _ in range(n_sub):
+            anchor_pos += anchor_vel * dt
+            self.anchor_update(anchor_pos, anchor_vel)
+            self.substep(F_ext, dt, iterations=iterations)
 
     def get_payload_state(self):
         return self.positions[-1].copy(), self.velocities[-1].copy()
 
+    def payload_view(self):
+        """Zero-copy, read-only (position, velocity) views of the payload node.
+
+        For internal per-substep use; the views track the live state, so
+        callers that keep them across steps should use get_payload_state().
+        """
+        p = self.positions[-1]
+        p.setflags(write=False)
+        v = self.velocities[-1]
+        v.setflags(write=False)
+        return p, v
+
+    def _segment_lengths(self) -> np.ndarray:
+        return np.hypot(
+            np.diff(self.px.astype(np.float64, copy=False)),
+            np.diff(self.py.astype(np.float64, copy=False)),
+        )
+
     def get_tension_profile(self) -> np.ndarray:
-        tensions = np.zeros(self.N, dtype=float)
-        for i in range(self.N):
-            p0, p1 = self.positions[i], self.positions[i + 1]
-            dist = float(np.linalg.norm(p1 - p0))
-            tensions[i] = self.k * max(0.0, dist - self.segment_length)
-        return tensions
+        return self.k * np.maximum(0.0, self._segment_lengths() - self.segment_length)
 
     def total_energy_mech(self) -> float:
-        kinetic = 0.5 * self.m_segment * float(np.sum(np.linalg.norm(self.velocities[1:], axis=1) ** 2))
-        elastic = 0.0
-        for i in range(self.N):
-            p0, p1 = self.positions[i], self.positions[i + 1]
-            dist = float(np.linalg.norm(p1 - p0))
-            stretch = dist - self.segment_length
-            elastic += 0.5 * self.k * (stretch * stretch)
+        kinetic = 0.5 * self.m_segment * float(np.sum(self._vxy[:, 1:] ** 2, dtype=np.float64))
+        stretch = self._segment_lengths() - self.segment_length
+        elastic = 0.5 * self.k * float(np.dot(stretch, stretch))
         return kinetic + elastic
@@ -0,0 +1,160 @@
+# ============================================================
+# File: core/tether_kernels.py
+# GLIDE v3.1 – Compiled Tether Substep Kernels (numba, optional)
+# ============================================================
+
+from __future__ import annotations
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; DynamicTether falls back to NumPy
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def _segment_force(px, py, vx, vy, i, k, c, segment_length):
+    """Spring-damper force on node i from segment i (node i+1 gets the negative)."""
+    rx = px[i + 1] - px[i]
+    ry = py[i + 1] - py[i]
+    L = math.sqrt(rx * rx + ry * ry)
+    if L < 1e-12:
+        return 0.0, 0.0
+    ux = rx / L
+    uy = ry / L
+    rel_vel = (vx[i + 1] - vx[i]) * ux + (vy[i + 1] - vy[i]) * uy
+    s = -k * (L - segment_length) - c * rel_vel
+    return s * ux, s * uy
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _forces(px, py, vx, vy, fex, fey, k, c, segment_length, fx, fy):
+    """Internal spring-damper forces plus the external (fex, fey), written into (fx, fy).
+
+    Gathered per node (each node reads its two neighbouring segments) so the
+    prange never writes to a shared slot.
+    """
+    N = px.shape[0] - 1
+    for j in prange(N + 1):
+        ax = 0.0
+        ay = 0.0
+        if j > 0:
+            sx, sy = _segment_force(px, py, vx, vy, j - 1, k, c, segment_length)
+            ax -= sx
+            ay -= sy
+        if j < N:
+            sx, sy = _segment_force(px, py, vx, vy, j, k, c, segment_length)
+            ax += sx
+            ay += sy
+        fx[j] = ax + fex[j]
+        fy[j] = ay + fey[j]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _integrate(px, py, vx, vy, fx, fy, ppx, ppy, kick, dt, decay):
+    """Semi-implicit Euler on the non-anchor nodes; snapshots (ppx, ppy) first."""
+    N = px.shape[0] - 1
+    for j in prange(N + 1):
+        ppx[j] = px[j]
+        ppy[j] = py[j]
+        if j == 0:
+            continue
+        vx[j] = vx[j] * decay + fx[j] * kick
+        vy[j] = vy[j] * decay + fy[j] * kick
+        px[j] += vx[j] * dt
+        py[j] += vy[j] * dt
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _constraints(px, py, vx, vy, ppx, ppy, segment_length, n_iters, dt):
+    """Length relaxation, then velocities from corrected positions.
+
+    The sweep stays sequential, anchor to tip (Gauss-Seidel: each segment sees
+    the last update). The order matters physically: the tip segment is fixed
+    last, so the motor reads the same tip tension as the original model.
+    """
+    N = px.shape[0] - 1
+    for _ in range(n_iters):
+        for i in range(N):
+            dx = px[i + 1] - px[i]
+            dy = py[i + 1] - py[i]
+            dist = math.sqrt(dx * dx + dy * dy)
+            if dist < 1e-12:
+                continue
+            diff = (dist - segment_length) / dist
+            if i == 0:
+                px[i + 1] -= dx * diff
+                py[i + 1] -= dy * diff
+            else:
+                cx = 0.5 * dx * diff
+                cy = 0.5 * dy * diff
+                px[i] += cx
+                py[i] += cy
+                px[i + 1] -= cx
+                py[i + 1] -= cy
+        px[0] = ppx[0]
+        py[0] = ppy[0]
+
+    # velocity recompute => stops constraint energy injection
+    for j in prange(1, N + 1):
+        vx[j] = (px[j] - ppx[j]) / dt
+        vy[j] = (py[j] - ppy[j]) / dt
+
+
+@njit(cache=True)
+def substep(px, py, vx, vy, fx, fy, ppx, ppy, fex, fey,
+            k, c, segment_length, dt, n_iters, kick, decay):
+    """One tether substep, in place: internal + external forces, integrate, constrain.
+
+    Mirrors DynamicTether.compute_internal_forces / add_external_forces /
+    integrate / enforce_constraints on the SoA coordinate arrays. kick
+    (decay * dt / m_segment) and decay come from the tether's dt cache.
+    """
+    _forces(px, py, vx, vy, fex, fey, k, c, segment_length, fx, fy)
+    if dt <= 0.0:
+        return
+
+    _integrate(px, py, vx, vy, fx, fy, ppx, ppy, kick, dt, decay)
+    if n_iters <= 0:
+        return
+
+    _constraints(px, py, vx, vy, ppx, ppy, segment_length, n_iters, dt)
+
+
+@njit(cache=True)
+def step_many(px, py, vx, vy, fx, fy, ppx, ppy, fex, fey, anchor_pos, avx, avy,
+              k, c, segment_length, dt, n_sub, n_iters, kick, decay):
+    """n_sub substeps under a constant external force, in one compiled call.
+
+    The anchor moves at (avx, avy) and is re-pinned before every substep, as
+    in the integrator's Python substep loop; anchor_pos is updated in place.
+    """
+    for _ in range(n_sub):
+        anchor_pos[0] += avx * dt
+        anchor_pos[1] += avy * dt
+        px[0] = anchor_pos[0]
+        py[0] = anchor_pos[1]
+        vx[0] = avx
+        vy[0] = avy
+        substep(px, py, vx, vy, fx, fy, ppx, ppy, fex, fey,
+                k, c, segment_length, dt, n_iters, kick, decay)
+
+
+def warmup(dtype) -> None:
+    """Compile (or load from cache) the kernels for dtype on a 2-segment chain."""
+    px = np.zeros(3, dtype=dtype)
+    py = np.array([0.0, -1.0, -2.0], dtype=dtype)
+    vx, vy, fx, fy = (np.zeros(3, dtype=dtype) for _ in range(4))
+    fex = np.zeros((3, 2), order="F")
+    substep(px, py, vx, vy, fx, fy, px.copy(), py.copy(), fex[:, 0], fex[:, 1],
+            1.0, 0.1, 1.0, 1e-3, 1, 1e-3, 1.0)
+    step_many(px, py, vx, vy, fx, fy, px.copy(), py.copy(), fex[:, 0], fex[:, 1],
+              np.zeros(2), 0.0, 0.0, 1.0, 0.1, 1.0, 1e-3, 1, 1, 1e-3, 1.0)
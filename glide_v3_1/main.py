@@ -38,7 +38,7 @@ def main():
     )
 
     print("\n================= SIMULATION COMPLETE =================")
-    print(f"Total steps: {int(sim_duration / cfg['dt'])}")
+    print(f"Total steps: {int(sim_duration / cfg.dt)}")
     print(f"Final Time:  {sim_duration:.2f} s")
     print("--------------------------------------------------------")
     print(f"Battery SoC: {summary['SoC']*100:8.5f}%")
@@ -48,7 +48,7 @@ def main():
     print(f"Gravitational: {summary['E_grav']:.2f} J")
     print("--------------------------------------------------------")
 
-    if cfg.get("save_energy_csv", True):
+    if cfg.save_energy_csv:
         sim.energy.export_csv("glide_v3_energy_log.csv")
         print("Energy log saved to glide_v3_energy_log.csv")
 
@@ -0,0 +1,102 @@
+# ============================================================
+# File: utils/regression.py
+# GLIDE v3.1 – Summary Regression Check (both tether paths)
+# ============================================================
+#
+# Runs each preset through GLIDEIntegrator.run with the main.py command
+# profiles and compares the end-of-run summary against reference values
+# recorded with the original model.
+#
+#   py -m utils.regression            # compiled kernel (if numba) + NumPy path
+#
+# Both tether paths must match the reference to round-off: a numerics change
+# that moves these values changes the physics, and results must not depend on
+# whether numba is installed.
+
+from __future__ import annotations
+import sys
+
+from core import tether_kernels
+from core.integrator import GLIDEIntegrator
+from utils.config import load_config
+
+# mode -> (duration [s], reference summary)
+REFERENCE = {
+    "local_demo": (10.0, {
+        "E_kin": 0.7279444799665136,
+        "E_elastic": 1.286186852323943,
+        "SoC": 0.9999813330710267,
+        "payload_y": -100.01435446891726,
+        "anchor_y": 0.003402837354246854,
+    }),
+    "engineering": (60.0, {
+        "E_kin": 1.946074250904704,
+        "E_elastic": 0.25262865838029264,
+        "SoC": 0.9997320104110698,
+        "payload_y": -250.02738274956994,
+        "anchor_y": 0.0034028372852063227,
+    }),
+    "orbital_test": (30.0, {
+        "E_kin": 0.6731553873918721,
+        "E_elastic": 5.624288391468932,
+        "SoC": 0.9939692619529288,
+        "payload_y": -300.0576588837127,
+        "anchor_y": -0.0010245230951245457,
+    }),
+}
+
+# key -> (kind, tolerance), same for both tether paths
+TOLERANCE = {
+    "E_kin": ("rel", 1e-6),
+    "E_elastic": ("rel", 1e-6),
+    "SoC": ("abs", 1e-9),
+    "payload_y": ("abs", 1e-6),
+    "anchor_y": ("abs", 1e-6),
+}
+
+
+def run_summary(mode: str, duration: float) -> dict:
+    from main import winch_profile, current_profile
+
+    sim = GLIDEIntegrator(load_config(mode))
+    sim.energy.log_interval_s = 0.0
+    summary = sim.run(duration, winch_profile, current_profile)
+    summary["payload_y"] = float(sim.tether.positions[-1, 1])
+    summary["anchor_y"] = float(sim.anchor_pos[1])
+    return summary
+
+
+def check(compiled: bool) -> bool:
+    """Run every preset on one tether path; print and return pass/fail."""
+    have_numba = tether_kernels.HAVE_NUMBA
+    tether_kernels.HAVE_NUMBA = have_numba and compiled
+    label = "compiled" if compiled else "numpy"
+    ok = True
+    try:
+        for mode, (duration, ref) in REFERENCE.items():
+            got = run_summary(mode, duration)
+            for key, expected in ref.items():
+                kind, tol = TOLERANCE[key]
+                err = abs(got[key] - expected)
+                if kind == "rel":
+                    err /= abs(expected)
+                passed = err <= tol
+                ok &= passed
+                print(f"[{label:<8s}] {mode:<12s} {key:<10s} {got[key]:>16.8f} "
+                      f"ref {expected:>16.8f}  {kind} err {err:.2e}  {'ok' if passed else 'FAIL'}")
+    finally:
+        tether_kernels.HAVE_NUMBA = have_numba
+    return ok
+
+
+def main() -> int:
+    ok = True
+    if tether_kernels.HAVE_NUMBA:
+        ok &= check(compiled=True)
+    ok &= check(compiled=False)
+    print("\nREGRESSION", "PASSED" if ok else "FAILED")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
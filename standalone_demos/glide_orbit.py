@@ -6,12 +6,23 @@
 # Visualization: Corrected animation, zoomed orbits, moving markers
 # ============================================================
 
+import math
 import numpy as np
 import matplotlib
 matplotlib.use('QtAgg')   # Use stable modern GUI backend for animation
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional -> same functions run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 # ------------------------------------------------------------
 # PARAMETERS
 # ------------------------------------------------------------
@@ -42,30 +53,75 @@ state_payload = np.hstack((r0_vec, v0_vec))
 # ------------------------------------------------------------
 # FUNCTIONS
 # ------------------------------------------------------------
-def accel(r_vec):
-    r = np.linalg.norm(r_vec)
-    return -μ * r_vec / r**3
-
-def rk4_step(state, dt):
-    r, v = state[:2], state[2:]
-    k1_r, k1_v = v, accel(r)
-    k2_r, k2_v = v + 0.5*dt*k1_v, accel(r + 0.5*dt*k1_r)
-    k3_r, k3_v = v + 0.5*dt*k2_v, accel(r + 0.5*dt*k2_r)
-    k4_r, k4_v = v + dt*k3_v, accel(r + dt*k3_r)
-    r_next = r + (dt/6)*(k1_r + 2*k2_r + 2*k3_r + k4_r)
-    v_next = v + (dt/6)*(k1_v + 2*k2_v + 2*k3_v + k4_v)
-    return np.hstack((r_next, v_next))
-
-def orbital_elements(state):
-    r_vec, v_vec = state[:2], state[2:]
-    r, v = np.linalg.norm(r_vec), np.linalg.norm(v_vec)
-    h_vec = np.cross(np.append(r_vec,0), np.append(v_vec,0))
-    h = np.linalg.norm(h_vec)
-    a = 1 / (2/r - v**2/μ)
-    ecc_term = max(0.0, 1 - (h**2)/(a*μ))
-    e = np.sqrt(ecc_term)
+# State is passed as flat scalars (x, y, vx, vy) so the compiled
+# loop never builds temporary arrays.
+@njit(cache=True)
+def _nrm2(x, y):
+    return math.sqrt(x*x + y*y)
+
+@njit(cache=True)
+def accel(x, y):
+    r3 = (x*x + y*y)**1.5
+    return -μ * x / r3, -μ * y / r3
+
+@njit(cache=True)
+def rk4_step(x, y, vx, vy, dt):
+    k1_x, k1_y = vx, vy
+    k1_vx, k1_vy = accel(x, y)
+    k2_x, k2_y = vx + 0.5*dt*k1_vx, vy + 0.5*dt*k1_vy
+    k2_vx, k2_vy = accel(x + 0.5*dt*k1_x, y + 0.5*dt*k1_y)
+    k3_x, k3_y = vx + 0.5*dt*k2_vx, vy + 0.5*dt*k2_vy
+    k3_vx, k3_vy = accel(x + 0.5*dt*k2_x, y + 0.5*dt*k2_y)
+    k4_x, k4_y = vx + dt*k3_vx, vy + dt*k3_vy
+    k4_vx, k4_vy = accel(x + dt*k3_x, y + dt*k3_y)
+    return (x + (dt/6)*(k1_x + 2*k2_x + 2*k3_x + k4_x),
+            y + (dt/6)*(k1_y + 2*k2_y + 2*k3_y + k4_y),
+            vx + (dt/6)*(k1_vx + 2*k2_vx + 2*k3_vx + k4_vx),
+            vy + (dt/6)*(k1_vy + 2*k2_vy + 2*k3_vy + k4_vy))
+
+@njit(cache=True)
+def orbital_elements(x, y, vx, vy):
+    r = _nrm2(x, y)
+    v2 = vx*vx + vy*vy
+    h = abs(x*vy - y*vx)     # |r × v|, scalar 2-D cross
+    a = 1 / (2/r - v2/μ)
+    ecc_term = max(0.0, 1 - (h*h)/(a*μ))
+    e = math.sqrt(ecc_term)
     return r, a, e
 
+@njit(cache=True)
+def integrate_body(state, Δv, t_arr, dt, r_out, a_out, e_out):
+    """Whole RK4 run for one body in a compiled loop; fills the preallocated
+    outputs row by row and leaves the final state in `state`.
+
+    At T_event the body gets Δv along its own velocity. Node and payload
+    start identical, so that direction is the shared pre-event tangent
+    and the bodies never need to see each other.
+    """
+    x, y, vx, vy = state[0], state[1], state[2], state[3]
+
+    for i in range(t_arr.shape[0]):
+        # store
+        r_out[i, 0], r_out[i, 1] = x, y
+        _, a_out[i], e_out[i] = orbital_elements(x, y, vx, vy)
+
+        # tether impulse
+        if abs(t_arr[i] - T_event) < dt/2:
+            v = _nrm2(vx, vy)
+            ux, uy = vx / v, vy / v
+            vx += Δv * ux
+            vy += Δv * uy
+
+        x, y, vx, vy = rk4_step(x, y, vx, vy, dt)
+
+    state[0], state[1], state[2], state[3] = x, y, vx, vy
+
+@njit(cache=True, parallel=True)
+def integrate(states, Δvs, t_arr, dt, r_out, a_out, e_out):
+    """Integrate every body (row of `states`) independently, one per thread."""
+    for b in prange(states.shape[0]):
+        integrate_body(states[b], Δvs[b], t_arr, dt, r_out[b], a_out[b], e_out[b])
+
 def perigee_apogee(a, e):
     rp = a*(1 - e) - R_E
     ra = a*(1 + e) - R_E
@@ -75,28 +131,18 @@ def perigee_apogee(a, e):
 # STORAGE
 # ------------------------------------------------------------
 t_arr = np.linspace(0, t_final, N)
-r_node, r_payload = np.zeros((N,2)), np.zeros((N,2))
-a_node, e_node, a_payload, e_payload = [], [], [], []
+# one row per body: 0 = node, 1 = payload
+states = np.vstack((state_node, state_payload))
+r_out, a_out, e_out = np.zeros((2,N,2)), np.zeros((2,N)), np.zeros((2,N))
+state_node, state_payload = states
+r_node, r_payload = r_out
+a_node, a_payload = a_out
+e_node, e_payload = e_out
 
 # ------------------------------------------------------------
 # INTEGRATION LOOP
 # ------------------------------------------------------------
-for i, t in enumerate(t_arr):
-    # store
-    r_node[i], r_payload[i] = state_node[:2], state_payload[:2]
-    rn, an, en = orbital_elements(state_node)
-    rp, ap, ep = orbital_elements(state_payload)
-    a_node.append(an); e_node.append(en)
-    a_payload.append(ap); e_payload.append(ep)
-
-    # tether impulse
-    if abs(t - T_event) < dt/2:
-        unit_tan = state_payload[2:] / np.linalg.norm(state_payload[2:])
-        state_payload[2:] += Δv_payload * unit_tan
-        state_node[2:] += Δv_node * unit_tan
-
-    state_node = rk4_step(state_node, dt)
-    state_payload = rk4_step(state_payload, dt)
+integrate(states, np.array([Δv_node, Δv_payload]), t_arr, dt, r_out, a_out, e_out)
 
 # ------------------------------------------------------------
 # SUMMARY
@@ -112,7 +158,7 @@ print(f"Node orbit   → Perigee {rp_node:.1f} km | Apogee {ra_node:.1f} km")
 print(f"Payload orbit→ Perigee {rp_payload:.1f} km | Apogee {ra_payload:.1f} km")
 
 momentum_before = (m_payload + m_node) * v_circ
-momentum_after = m_payload*np.linalg.norm(state_payload[2:]) + m_node*np.linalg.norm(state_node[2:])
+momentum_after = m_payload*_nrm2(state_payload[2], state_payload[3]) + m_node*_nrm2(state_node[2], state_node[3])
 print(f"Momentum check          : {momentum_before:.3e} / {momentum_after:.3e}")
 
 # ------------------------------------------------------------
@@ -166,8 +212,8 @@ plt.show()
 # DIAGNOSTICS
 # ------------------------------------------------------------
 fig2, axs = plt.subplots(3,1,figsize=(8,8))
-axs[0].plot(t_arr/3600, (np.linalg.norm(r_node,axis=1)-R_E)/1e3, label='Node')
-axs[0].plot(t_arr/3600, (np.linalg.norm(r_payload,axis=1)-R_E)/1e3, label='Payload')
+axs[0].plot(t_arr/3600, (np.hypot(r_node[:,0], r_node[:,1])-R_E)/1e3, label='Node')
+axs[0].plot(t_arr/3600, (np.hypot(r_payload[:,0], r_payload[:,1])-R_E)/1e3, label='Payload')
 axs[0].set_ylabel('Radius [km]'); axs[0].legend()
 
 axs[1].plot(t_arr/3600, np.array(a_node)/1e3, label='Node')